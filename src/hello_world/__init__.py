@@ -2,14 +2,18 @@
 
 A simple Python package template demonstrating best practices.
 
+The greeting functions from hello_world.main are loaded lazily (PEP 562).
+The bundled logging.conf is applied when hello_world.main is first
+imported, whether directly or through one of these exports, so importing
+just the package does no file I/O and does not load the logging modules.
+
 Author: JacobPEvans
 Created: July 12, 2025
 """
 
 from __future__ import annotations
 
-import logging.config
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 from hello_world.exceptions import (
     BatchGreetingError,
@@ -18,12 +22,6 @@ from hello_world.exceptions import (
     HelloWorldError,
     ValidationError,
 )
-from hello_world.main import (
-    create_greeting_template,
-    format_greeting,
-    greet,
-    greet_many,
-)
 from hello_world.validators import (
     validate_name,
     validate_names_batch,
@@ -31,12 +29,36 @@ from hello_world.validators import (
 )
 
 
-# Construct the full path to the logging configuration file
-_config_path = Path(__file__).parent / "logging.conf"
+if TYPE_CHECKING:
+    from hello_world.main import (
+        create_greeting_template,
+        format_greeting,
+        greet,
+        greet_many,
+    )
+
+
+# Public names re-exported from hello_world.main on first access
+_LAZY_MAIN_EXPORTS = frozenset({"create_greeting_template", "format_greeting", "greet", "greet_many"})
+
+
+def __getattr__(name: str) -> object:
+    """Load the greeting functions lazily from hello_world.main."""
+    if name not in _LAZY_MAIN_EXPORTS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    from hello_world import main  # noqa: PLC0415
+
+    value = getattr(main, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package attributes, including lazy exports not loaded yet."""
+    return sorted({*globals(), *_LAZY_MAIN_EXPORTS})
 
-# Configure the logging using the file
-if _config_path.exists():
-    logging.config.fileConfig(_config_path)
 
 __version__ = "0.1.0"
 __author__ = "JacobPEvans"
@@ -160,7 +160,7 @@ class BatchGreetingError(HelloWorldError):
     and one or more fail.
 
     Attributes:
-        failed_names: The names that failed to be greeted.
+        failed_names: The names that failed to be greeted, as a tuple.
         total_count: Total number of names attempted.
         success_count: Number of successful greetings.
     """
@@ -181,12 +181,17 @@ class BatchGreetingError(HelloWorldError):
             success_count: Number of successful greetings.
             details: Optional additional details about the error.
         """
-        self.failed_names = list(failed_names)
+        self.failed_names = tuple(failed_names)
         self.total_count = total_count
         self.success_count = success_count
-        message = (
-            f"Batch greeting failed: {len(failed_names)}/{total_count} failures. "
-            f"Failed names: {', '.join(failed_names[:_MAX_DISPLAY_NAMES])}"
-            f"{'...' if len(failed_names) > _MAX_DISPLAY_NAMES else ''}"
-        )
-        super().__init__(message, details)
+        parts = [
+            "Batch greeting failed: ",
+            str(len(self.failed_names)),
+            "/",
+            str(total_count),
+            " failures. Failed names: ",
+            ", ".join(self.failed_names[:_MAX_DISPLAY_NAMES]),
+        ]
+        if len(self.failed_names) > _MAX_DISPLAY_NAMES:
+            parts.append("...")
+        super().__init__("".join(parts), details)
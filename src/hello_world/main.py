@@ -9,7 +9,9 @@ Created: July 12, 2025
 
 from __future__ import annotations
 
+import functools
 import logging
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 
@@ -17,11 +19,42 @@ if TYPE_CHECKING:
     from collections.abc import Iterable
 
 from hello_world.exceptions import BatchGreetingError, GreetingError, ValidationError
-from hello_world.validators import validate_name
+from hello_world.validators import _check_name, validate_name
 
 
+def _configure_logging() -> None:
+    """Apply the bundled logging configuration.
+
+    Loggers that already exist, such as those of an application that
+    imports this package, are left enabled.
+    """
+    config_path = Path(__file__).parent / "logging.conf"
+    if config_path.is_file():
+        # Imported here so that only a present config loads logging.config
+        import logging.config  # noqa: PLC0415
+
+        logging.config.fileConfig(config_path, disable_existing_loggers=False)
+
+
+_configure_logging()
 logger = logging.getLogger(__name__)
 
+# Returned as-is for the default case instead of formatting a new string
+_DEFAULT_GREETING = "Hello, World!"
+
+
+def _lenient_name(name: str | None) -> str | None:
+    """Validate a name for the non-strict paths, without raising.
+
+    Returns:
+        The validated name, or None if it is empty or invalid (an invalid
+        name is logged as a warning), so the caller falls back to "World".
+    """
+    validated_name, reason = _check_name(name)
+    if reason is not None:
+        logger.warning("Name validation failed, defaulting to 'World': %s", reason)
+    return validated_name
+
 
 def greet(name: str | None = None, *, strict: bool = False) -> str:
     """Generate a greeting message.
@@ -45,24 +78,28 @@ def greet(name: str | None = None, *, strict: bool = False) -> str:
         >>> greet("")
         'Hello, World!'
     """
-    try:
-        validated_name = validate_name(name)
-    except ValidationError as e:
-        if strict:
+    if strict:
+        try:
+            validated_name = validate_name(name)
+        except ValidationError as e:
             raise GreetingError(
                 error_type="validation_failed",
                 name=name,
                 details=str(e),
             ) from e
-        logger.warning("Name validation failed, defaulting to 'World': %s", e)
-        validated_name = None
+    else:
+        # The non-strict path needs no exception handling at all
+        validated_name = _lenient_name(name)
 
+    # logging.conf enables INFO, so these guards only pay off for applications
+    # that raise this logger's level to skip the log calls
     if not validated_name:
-        logger.info("No name provided, defaulting to 'World'")
-        validated_name = "World"
-    else:
-        logger.info("Greeting name: %s", validated_name)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("No name provided, defaulting to 'World'")
+        return _DEFAULT_GREETING
 
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Greeting name: %s", validated_name)
     return f"Hello, {validated_name}!"
 
 
@@ -74,11 +111,16 @@ def greet_many(
     """Generate greetings for multiple names.
 
     Note:
-        The input iterable is fully consumed into a list before processing.
-        For large iterables or generators, be aware of memory usage.
+        In strict mode the input iterable is fully consumed into a list
+        before processing, so be aware of memory usage for large iterables
+        or generators. In non-strict mode the names are consumed lazily and
+        the greetings built in a single pass, without the per-name info
+        logging that greet() performs; each distinct name is only validated
+        (and warned about) once per call.
 
     Args:
-        names: An iterable of names to greet. Will be consumed into a list.
+        names: An iterable of names to greet. In strict mode it is consumed
+            into a list first.
         strict: If True, raises BatchGreetingError if any greetings fail.
                 If False, uses "World" for failed names.
 
@@ -94,15 +136,25 @@ def greet_many(
         >>> greet_many([None, "Charlie"])
         ['Hello, World!', 'Hello, Charlie!']
     """
+    if not strict:
+        # Repeated names are common in batches; build each distinct greeting once
+        cache: dict[str | None, str] = {}
+        results: list[str] = []
+        for name in names:
+            greeting = cache.get(name)
+            if greeting is None:
+                greeting = cache[name] = f"Hello, {_lenient_name(name) or 'World'}!"
+            results.append(greeting)
+        return results
+
     names_list = list(names)
-    results: list[str] = []
+    results = []
     failed_names: list[str] = []
 
     for name in names_list:
         try:
-            results.append(greet(name, strict=strict))
+            results.append(greet(name, strict=True))
         except GreetingError:
-            # Only raised when strict=True - track failures for batch error
             failed_names.append(str(name))
 
     if failed_names:
@@ -137,6 +189,21 @@ def create_greeting_template(
     return f"{greeting_word}, {{name}}{punctuation}"
 
 
+@functools.lru_cache(maxsize=64)
+def _split_template(template: str) -> tuple[str, str] | None:
+    """Split a simple template around its single {name} placeholder.
+
+    Returns None for anything str.format would treat differently from plain
+    concatenation (no placeholder, repeated or other fields, escaped braces),
+    so those templates keep going through str.format.
+    """
+    prefix, placeholder, suffix = template.partition("{name}")
+    rest = prefix + suffix
+    if not placeholder or "{" in rest or "}" in rest:
+        return None
+    return prefix, suffix
+
+
 def format_greeting(template: str, name: str | None = None) -> str:
     """Format a greeting using a template.
 
@@ -154,12 +221,11 @@ def format_greeting(template: str, name: str | None = None) -> str:
         >>> format_greeting("Hi, {name}?", None)
         'Hi, World?'
     """
-    try:
-        validated_name = validate_name(name) or "World"
-    except ValidationError:
-        logger.warning("Name validation failed in format_greeting, defaulting to 'World'.")
-        validated_name = "World"
-    return template.format(name=validated_name)
+    validated_name = _lenient_name(name) or "World"
+    parts = _split_template(template)
+    if parts is None:
+        return template.format(name=validated_name)
+    return parts[0] + validated_name + parts[1]
 
 
 def main() -> None:
@@ -9,13 +9,16 @@ Author: JacobPEvans
 from __future__ import annotations
 
 import functools
-import inspect
 import re
-from typing import TYPE_CHECKING, ParamSpec, TypeVar
+import sys
+import types
+from collections.abc import Mapping
+from collections.abc import Set as AbstractSet
+from typing import TYPE_CHECKING, ParamSpec, TypeVar, cast
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterable, Sequence
 
 from hello_world.exceptions import ValidationError
 
@@ -27,7 +30,83 @@ R = TypeVar("R")
 # Constants for validation
 MAX_NAME_LENGTH = 100
 MIN_NAME_LENGTH = 1
-ALLOWED_NAME_PATTERN = re.compile(r"^[\w\s\-'.]+$", re.UNICODE)
+# Characters allowed in a name, as the body of a regex character class. Every
+# other name check is built from this, so they cannot drift apart.
+_NAME_CHAR_CLASS = r"\w\s\-'."
+# \A and \Z anchor to the whole string ($ would also match before a trailing newline)
+ALLOWED_NAME_PATTERN = re.compile(rf"\A[{_NAME_CHAR_CLASS}]+\Z", re.UNICODE)
+
+# Reasons reported in ValidationError.reason
+REASON_TOO_LONG = f"must be at most {MAX_NAME_LENGTH} characters"
+REASON_INVALID_CHARS = (
+    "contains invalid characters (only letters, numbers, spaces, hyphens, apostrophes, and periods allowed)"
+)
+REASON_NOT_ITERABLE = "must be a list, tuple, or other ordered iterable (not a string, set, or mapping)"
+REASON_NOT_STRING = "must be a string or None"
+REASON_NOT_INTEGER = "must be an integer"
+REASON_NOT_POSITIVE = "must be a positive integer"
+
+# Marks a parameter without a default in validated()
+_NO_DEFAULT = object()
+
+# Field names reported in ValidationError (passed positionally on the hot paths)
+_NAME_FIELD = "name"
+_NAMES_FIELD = "names"
+
+# Bound once so the hot path in validate_name skips the attribute lookup
+_NAME_MATCH = ALLOWED_NAME_PATTERN.match
+
+# ASCII characters accepted by ALLOWED_NAME_PATTERN, derived from the pattern so
+# the two cannot drift apart. Deleting these from an ASCII name leaves only the
+# disallowed characters.
+_ASCII_NAME_CHARS = bytes(c for c in range(128) if _NAME_MATCH(chr(c)))
+
+# Short ASCII names are checked against this set instead: a handful of hash
+# lookups beats encoding the name. Past roughly 16 characters the byte scan wins.
+_ASCII_NAME_SET = frozenset(_ASCII_NAME_CHARS.decode("ascii"))
+_SHORT_NAME_LENGTH = 16
+
+# Batches are validated as one string joined on NUL, which is never allowed in
+# a name. These accept the allowed characters plus the separator.
+_BATCH_SEPARATOR = "\x00"
+_ASCII_BATCH_CHARS = _ASCII_NAME_CHARS + _BATCH_SEPARATOR.encode("ascii")
+_BATCH_FULLMATCH = re.compile(rf"[{_NAME_CHAR_CLASS}{re.escape(_BATCH_SEPARATOR)}]*", re.UNICODE).fullmatch
+
+
+@functools.lru_cache(maxsize=4096)
+def _has_allowed_chars(name: str) -> bool:
+    """Check that every character of a name is allowed by ALLOWED_NAME_PATTERN.
+
+    ASCII names are checked with a set lookup (short names) or a C-level
+    byte scan; anything else falls back to the Unicode-aware regex.
+    Memoized because batches tend to repeat names; callers only pass names
+    within MAX_NAME_LENGTH, which bounds the cache's memory.
+    """
+    if name.isascii():
+        if len(name) <= _SHORT_NAME_LENGTH:
+            return _ASCII_NAME_SET.issuperset(name)
+        return not name.encode("ascii").translate(None, _ASCII_NAME_CHARS)
+    return _NAME_MATCH(name) is not None
+
+
+def _all_names_allowed(names: list[str]) -> bool:
+    """Check that every stripped name in a batch passes validation.
+
+    Empty strings are allowed (they become None). The names are joined on
+    _BATCH_SEPARATOR so the character check is a single C-level scan.
+    """
+    if not names:
+        return True
+    if max(map(len, names)) > MAX_NAME_LENGTH:
+        return False
+
+    joined = _BATCH_SEPARATOR.join(names)
+    if joined.count(_BATCH_SEPARATOR) != len(names) - 1:
+        # A name contains the separator itself
+        return False
+    if joined.isascii():
+        return not joined.encode("ascii").translate(None, _ASCII_BATCH_CHARS)
+    return _BATCH_FULLMATCH(joined) is not None
 
 
 def validate_name(name: str | None) -> str | None:
@@ -49,68 +128,102 @@ def validate_name(name: str | None) -> str | None:
         >>> validate_name(None)
         >>> validate_name("  ")
     """
+    validated_name, reason = _check_name(name)
+    if reason is not None:
+        # A reason is only returned for a non-empty string
+        raise ValidationError(_NAME_FIELD, cast("str", name).strip(), reason)
+    return validated_name
+
+
+def _check_name(name: str | None) -> tuple[str | None, str | None]:
+    """Validate a name without raising.
+
+    Used by validate_name and by the non-strict greeting paths, which fall
+    back to a default instead of handling an exception.
+
+    Returns:
+        (validated_name, None) on success, where validated_name is None for
+        None/empty input, or (None, reason) if the name is invalid.
+    """
     if name is None:
-        return None
+        return None, None
 
-    # Strip whitespace
+    # Strip whitespace. This does not allocate when there is nothing to strip
+    # (CPython returns the same object), so no pre-check is needed.
     name = name.strip()
 
     if not name:
-        return None
+        return None, None
 
-    # Check length constraints
+    # Checked before the memoized character check, so over-length input is
+    # never held in its cache
     if len(name) > MAX_NAME_LENGTH:
-        msg = f"must be at most {MAX_NAME_LENGTH} characters"
-        raise ValidationError(field="name", value=name, reason=msg)
+        return None, REASON_TOO_LONG
 
     # Check for valid characters (alphanumeric, spaces, hyphens, apostrophes, periods)
-    if not ALLOWED_NAME_PATTERN.match(name):
-        msg = "contains invalid characters (only letters, numbers, spaces, hyphens, apostrophes, and periods allowed)"
-        raise ValidationError(field="name", value=name, reason=msg)
+    if not _has_allowed_chars(name):
+        return None, REASON_INVALID_CHARS
 
-    return name
+    return name, None
 
 
-def validate_names_batch(names: Sequence[str | None]) -> list[str | None]:
+def validate_names_batch(names: Iterable[str | None]) -> list[str | None]:
     """Validate a batch of names.
 
     Args:
-        names: A sequence of names to validate.
+        names: An iterable of names to validate. Lists and tuples are used
+            as-is; other iterables are consumed into a tuple first. Strings
+            are rejected rather than treated as a sequence of characters,
+            and sets and mappings because they have no meaningful order for
+            the per-index error details.
 
     Returns:
         A list of validated names.
 
     Raises:
-        ValidationError: If the input is not a valid sequence.
-        ValidationError: If any name fails validation (includes index in details).
+        ValidationError: If the input is a string, set, mapping, or not iterable.
+        ValidationError: If any name is not a string or None, or fails
+            validation (includes index in details).
 
     Examples:
         >>> validate_names_batch(["Alice", "Bob", None])
         ['Alice', 'Bob', None]
     """
-    if not isinstance(names, list | tuple):
-        msg = "must be a list or tuple"
-        raise ValidationError(field="names", value=type(names).__name__, reason=msg)
-
-    validated: list[str | None] = []
-    errors: list[str] = []
-
-    for i, name in enumerate(names):
-        try:
-            validated.append(validate_name(name))
-        except ValidationError as e:
-            errors.append(f"Index {i}: {e.reason}")
-
-    if errors:
-        msg = f"batch validation failed for {len(errors)} item(s)"
-        raise ValidationError(
-            field="names",
-            value=f"batch of {len(names)} names",
-            reason=msg,
-            details="; ".join(errors),
-        )
-
-    return validated
+    items: Sequence[str | None]
+    # Exact type checks are a pointer compare, cheaper than isinstance for the common inputs
+    if type(names) is list or type(names) is tuple:
+        items = names
+    elif isinstance(names, str | bytes | bytearray | AbstractSet | Mapping) or not hasattr(names, "__iter__"):
+        raise ValidationError(_NAMES_FIELD, type(names).__name__, REASON_NOT_ITERABLE)
+    else:
+        items = tuple(names)
+
+    # Fast path: check the whole batch in one pass; only a failing batch is
+    # re-validated item by item to report which entries are invalid. The
+    # unbound str.strip raises TypeError for items that are not strings.
+    try:
+        stripped = ["" if name is None else str.strip(name) for name in items]
+    except TypeError:
+        pass
+    else:
+        if _all_names_allowed(stripped):
+            return [name or None for name in stripped]
+
+    checked = [
+        _check_name(name) if name is None or isinstance(name, str) else (None, REASON_NOT_STRING) for name in items
+    ]
+    errors = [f"Index {i}: {reason}" for i, (_, reason) in enumerate(checked) if reason is not None]
+    if not errors:
+        # The per-item checks are authoritative if the batch scan ever disagrees
+        return [validated_name for validated_name, _ in checked]
+
+    msg = f"batch validation failed for {len(errors)} item(s)"
+    raise ValidationError(
+        _NAMES_FIELD,
+        f"batch of {len(items)} names",
+        msg,
+        details="; ".join(errors),
+    )
 
 
 def validate_positive_int(value: int, field_name: str = "value") -> int:
@@ -124,7 +237,8 @@ def validate_positive_int(value: int, field_name: str = "value") -> int:
         The validated positive integer.
 
     Raises:
-        ValidationError: If the value is not a positive integer.
+        ValidationError: If the value is not a positive integer (bool is
+            rejected).
 
     Examples:
         >>> validate_positive_int(5)
@@ -134,17 +248,86 @@ def validate_positive_int(value: int, field_name: str = "value") -> int:
         ...
         ValidationError: Validation failed for 'value': must be a positive integer
     """
-    if not isinstance(value, int) or isinstance(value, bool):
-        msg = "must be an integer"
-        raise ValidationError(field=field_name, value=value, reason=msg)
+    # Exact type check first (a pointer compare); int subclasses such as
+    # IntEnum are still accepted, but bool is not
+    if type(value) is not int and (not isinstance(value, int) or isinstance(value, bool)):
+        raise ValidationError(field_name, value, REASON_NOT_INTEGER)
 
     if value <= 0:
-        msg = "must be a positive integer"
-        raise ValidationError(field=field_name, value=value, reason=msg)
+        raise ValidationError(field_name, value, REASON_NOT_POSITIVE)
 
     return value
 
 
+def _locate_argument(
+    func: Callable[..., object],
+    arg_name: str,
+) -> tuple[int, bool, object, tuple[object, ...]] | None:
+    """Find where a function receives an argument, for validated().
+
+    Reads the function's code object rather than building an
+    inspect.Signature, following __wrapped__ as inspect.signature does.
+    Other callables (functools.partial objects, callable instances,
+    builtins) fall back to _locate_in_signature.
+
+    Returns:
+        None if the function has no parameter called arg_name, otherwise
+        (index, by_keyword, default, fill): the argument's position
+        (sys.maxsize if it is keyword-only), whether it can be passed by
+        keyword, its default (or _NO_DEFAULT), and the defaults of the
+        positional parameters before it that also have defaults, which a
+        positional-only argument needs filled in when it is omitted.
+    """
+    target: object = func
+    while (wrapped := getattr(target, "__wrapped__", None)) is not None:
+        target = wrapped
+    if not isinstance(target, types.FunctionType):
+        return _locate_in_signature(func, arg_name)
+
+    code = target.__code__
+    positional = code.co_varnames[: code.co_argcount]
+    if arg_name in positional:
+        index = positional.index(arg_name)
+        defaults = target.__defaults__ or ()
+        default_index = index - (len(positional) - len(defaults))
+        if default_index < 0:
+            return index, index >= code.co_posonlyargcount, _NO_DEFAULT, ()
+        return index, index >= code.co_posonlyargcount, defaults[default_index], defaults[:default_index]
+
+    keyword_only = code.co_varnames[code.co_argcount : code.co_argcount + code.co_kwonlyargcount]
+    if arg_name in keyword_only:
+        # Keyword-only arguments can never be reached through args
+        return sys.maxsize, True, (target.__kwdefaults__ or {}).get(arg_name, _NO_DEFAULT), ()
+    return None
+
+
+def _locate_in_signature(
+    func: Callable[..., object],
+    arg_name: str,
+) -> tuple[int, bool, object, tuple[object, ...]] | None:
+    """Find where a callable receives an argument, using inspect.signature.
+
+    The slow path of _locate_argument, for callables without a code object
+    of their own. Returns the same tuple.
+    """
+    # Imported here so that decorating plain functions does not load inspect
+    import inspect  # noqa: PLC0415
+
+    fill: list[object] = []
+    for index, param in enumerate(inspect.signature(func).parameters.values()):
+        default = _NO_DEFAULT if param.default is param.empty else param.default
+        if param.name == arg_name:
+            if param.kind is param.KEYWORD_ONLY:
+                return sys.maxsize, True, default, ()
+            if param.kind in {param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD}:
+                filled = () if default is _NO_DEFAULT else tuple(fill)
+                return index, param.kind is param.POSITIONAL_OR_KEYWORD, default, filled
+            return None
+        # Only the defaults directly before the argument can be filled in
+        fill = [] if default is _NO_DEFAULT else [*fill, default]
+    return None
+
+
 def validated(
     validator: Callable[[str | None], str | None],
     arg_name: str = "name",
@@ -154,8 +337,12 @@ def validated(
     Creates a decorator that validates a specific argument using
     the provided validator function before calling the wrapped function.
 
-    This decorator handles both positional and keyword arguments by using
-    inspect.signature to bind arguments to their parameter names.
+    The argument's position and default are read once from the function's
+    code object at decoration time (following __wrapped__, as
+    inspect.signature does), or from inspect.signature for other callables,
+    so each call only has to look in kwargs or index into args. An omitted
+    argument has its default validated. If the function has no parameter
+    called arg_name it is returned unchanged.
 
     Args:
         validator: The validation function to apply.
@@ -173,21 +360,26 @@ def validated(
     """
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
-        sig = inspect.signature(func)
+        location = _locate_argument(func, arg_name)
+        if location is None:
+            return func
+        index, by_keyword, default, fill = location
+        # First position whose default is in fill (positional-only filling)
+        fill_start = index - len(fill)
 
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            # Bind positional and keyword arguments to parameter names
-            bound_args = sig.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-
-            # Validate the specified argument if present
-            if arg_name in bound_args.arguments:
-                validated_value = validator(bound_args.arguments[arg_name])
-                bound_args.arguments[arg_name] = validated_value
-
-            # Call the original function with potentially modified arguments
-            return func(*bound_args.args, **bound_args.kwargs)
+            if by_keyword and arg_name in kwargs:
+                kwargs[arg_name] = validator(kwargs[arg_name])  # type: ignore[arg-type]
+            elif index < len(args):
+                args = (*args[:index], validator(args[index]), *args[index + 1 :])  # type: ignore[arg-type,assignment]
+            elif default is not _NO_DEFAULT:
+                if by_keyword:
+                    kwargs[arg_name] = validator(default)  # type: ignore[arg-type]
+                elif len(args) >= fill_start:
+                    args = (*args, *fill[len(args) - fill_start :], validator(default))  # type: ignore[arg-type,assignment]
+
+            return func(*args, **kwargs)
 
         return wrapper
 
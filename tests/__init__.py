@@ -1,7 +1 @@
-"""Test package for hello_world.
-
-This package contains all unit tests for the hello_world application.
-
-Author: JacobPEvans
-Created: July 12, 2025
-"""
+"""Tests for the hello_world package."""
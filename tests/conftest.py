@@ -1,49 +1,40 @@
-"""Pytest configuration and shared fixtures.
-
-This module contains fixtures and configuration that are automatically
-available to all tests in the tests directory.
-
-Author: JacobPEvans
-"""
+"""Pytest configuration and shared fixtures."""
 
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+import os
+import sys
+from typing import TYPE_CHECKING, TypedDict
 from unittest.mock import MagicMock
 
 import pytest
+from hypothesis import settings
+
+from hello_world.validators import MAX_NAME_LENGTH
 
 
 if TYPE_CHECKING:
     from collections.abc import Generator
+    from types import ModuleType
 
 
 # Configure logging for tests
 logging.getLogger("hello_world").setLevel(logging.DEBUG)
 
+# Hypothesis profiles: "dev" locally, "ci" (fewer examples, no deadline on
+# shared runners) when HYPOTHESIS_PROFILE=ci. Examples are saved to the default
+# .hypothesis/ database, which CI caches between runs.
+settings.register_profile("dev", max_examples=50)
+settings.register_profile("ci", max_examples=20, deadline=None)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "dev"))
+
 
 # =============================================================================
 # Fixtures for greet function testing
 # =============================================================================
 
 
-@pytest.fixture
-def valid_names() -> list[str]:
-    """Provide a list of valid names for testing."""
-    return [
-        "Alice",
-        "Bob",
-        "Charlie",
-        "Dr. Smith",
-        "Mary-Jane",
-        "O'Connor",
-        "Test User 123",
-        "名前",  # Japanese
-        "Имя",  # Russian
-    ]
-
-
 @pytest.fixture
 def invalid_names() -> list[str]:
     """Provide a list of invalid names for testing."""
@@ -55,6 +46,18 @@ def invalid_names() -> list[str]:
     ]
 
 
+@pytest.fixture(scope="session")
+def too_long_name() -> str:
+    """Provide a name one character over the maximum length."""
+    return "A" * (MAX_NAME_LENGTH + 1)
+
+
+@pytest.fixture
+def invalid_batch_names(too_long_name: str) -> list[str]:
+    """Provide a batch with one invalid name in the middle."""
+    return ["Alice", too_long_name, "Bob"]
+
+
 @pytest.fixture
 def edge_case_names() -> list[str | None]:
     """Provide edge case names for testing."""
@@ -93,13 +96,40 @@ def captured_logs(caplog: pytest.LogCaptureFixture) -> pytest.LogCaptureFixture:
     return caplog
 
 
+@pytest.fixture
+def unloaded_hello_world(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Provide the hello_world package as if hello_world.main had not been imported.
+
+    Removes the cached greeting functions and the main submodule from the
+    package namespace and sys.modules, so the next access imports
+    hello_world.main afresh and applies logging.conf again. Everything is
+    restored afterwards by monkeypatch.
+    """
+    import hello_world
+    from hello_world import _LAZY_MAIN_EXPORTS
+
+    for name in (*_LAZY_MAIN_EXPORTS, "main"):
+        monkeypatch.delitem(vars(hello_world), name, raising=False)
+    monkeypatch.delitem(sys.modules, "hello_world.main", raising=False)
+    return hello_world
+
+
 # =============================================================================
 # Fixtures for exception testing
 # =============================================================================
 
 
+class ValidationErrorData(TypedDict):
+    """Constructor arguments for a sample ValidationError."""
+
+    field: str
+    value: str
+    reason: str
+    details: str
+
+
 @pytest.fixture
-def sample_validation_error() -> dict[str, object]:
+def sample_validation_error() -> ValidationErrorData:
     """Provide sample data for creating a ValidationError."""
     return {
         "field": "test_field",
@@ -1,7 +1,10 @@
-"""Tests for exceptions module.
+"""Tests for hello_world.exceptions."""
 
-Author: JacobPEvans
-"""
+from __future__ import annotations
+
+import copy
+import pickle
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -14,10 +17,30 @@ from hello_world.exceptions import (
 )
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from tests.conftest import ValidationErrorData
+
+
+pytestmark = pytest.mark.unit
+
+# Failed names for the truncation tests, built once per session
+_TRUNCATION_NAMES = tuple(f"Name{i}" for i in range(1000))
+
+# One instance of every package exception, shared by the catching tests
+_ERROR_FACTORIES = [
+    pytest.param(lambda: HelloWorldError("base"), id="HelloWorldError"),
+    pytest.param(lambda: ValidationError("f", "v", "r"), id="ValidationError"),
+    pytest.param(lambda: ConfigurationError("k", "e"), id="ConfigurationError"),
+    pytest.param(lambda: GreetingError("t"), id="GreetingError"),
+    pytest.param(lambda: BatchGreetingError([], 0, 0), id="BatchGreetingError"),
+]
+
+
 class TestHelloWorldError:
     """Test cases for base HelloWorldError exception."""
 
-    @pytest.mark.unit
     def test_basic_error(self) -> None:
         """Test basic error creation."""
         error = HelloWorldError("Test error message")
@@ -25,7 +48,6 @@ class TestHelloWorldError:
         assert error.message == "Test error message"
         assert error.details is None
 
-    @pytest.mark.unit
     def test_error_with_details(self) -> None:
         """Test error creation with details."""
         error = HelloWorldError("Test error", "Additional details")
@@ -33,7 +55,6 @@ class TestHelloWorldError:
         assert error.message == "Test error"
         assert error.details == "Additional details"
 
-    @pytest.mark.unit
     def test_error_repr(self) -> None:
         """Test error __repr__ method."""
         error = HelloWorldError("Test", "Details")
@@ -42,24 +63,45 @@ class TestHelloWorldError:
         assert "Test" in repr_str
         assert "Details" in repr_str
 
-    @pytest.mark.unit
     def test_error_is_exception(self) -> None:
         """Test that HelloWorldError is an Exception."""
         error = HelloWorldError("Test")
         assert isinstance(error, Exception)
 
-    @pytest.mark.unit
     def test_error_can_be_raised(self) -> None:
         """Test that error can be raised and caught."""
         with pytest.raises(HelloWorldError) as exc_info:
             raise HelloWorldError("Raised error")
         assert str(exc_info.value) == "Raised error"
 
+    def test_message_can_be_assigned(self) -> None:
+        """Test that message stays writable on subclasses."""
+        error = ValidationError("field", "value", "reason")
+        error.message = "Custom message"
+        assert str(error) == "Custom message"
+
+    @pytest.mark.parametrize("error_factory", _ERROR_FACTORIES)
+    def test_error_args_are_message(self, error_factory: Callable[[], HelloWorldError]) -> None:
+        """Test that every package error keeps (message,) as its args."""
+        error = error_factory()
+        assert error.args == (error.message,)
+
+    @pytest.mark.parametrize(
+        "round_trip",
+        [copy.copy, lambda error: pickle.loads(pickle.dumps(error))],  # noqa: S301
+        ids=["copy", "pickle"],
+    )
+    def test_error_survives_copy_and_pickle(self, round_trip: Callable[[HelloWorldError], HelloWorldError]) -> None:
+        """Test that copying or pickling an error keeps its message and details."""
+        clone = round_trip(HelloWorldError("Test", "Details"))
+        assert clone.args == ("Test",)
+        assert clone.message == "Test"
+        assert clone.details == "Details"
+
 
 class TestValidationError:
     """Test cases for ValidationError exception."""
 
-    @pytest.mark.unit
     def test_validation_error_creation(self) -> None:
         """Test ValidationError creation."""
         error = ValidationError(
@@ -73,7 +115,6 @@ class TestValidationError:
         assert "username" in str(error)
         assert "too short" in str(error)
 
-    @pytest.mark.unit
     def test_validation_error_with_details(self) -> None:
         """Test ValidationError with details."""
         error = ValidationError(
@@ -85,25 +126,22 @@ class TestValidationError:
         assert error.details == "Must contain @"
         assert "Details:" in str(error)
 
-    @pytest.mark.unit
-    def test_validation_error_inheritance(self) -> None:
-        """Test that ValidationError inherits from HelloWorldError."""
-        error = ValidationError("field", "value", "reason")
-        assert isinstance(error, HelloWorldError)
-        assert isinstance(error, Exception)
-
-    @pytest.mark.unit
-    def test_validation_error_with_fixture(self, sample_validation_error: dict[str, object]) -> None:
+    def test_validation_error_with_fixture(self, sample_validation_error: ValidationErrorData) -> None:
         """Test ValidationError creation using fixture."""
-        error = ValidationError(**sample_validation_error)  # type: ignore[arg-type]
+        error = ValidationError(
+            sample_validation_error["field"],
+            sample_validation_error["value"],
+            sample_validation_error["reason"],
+            details=sample_validation_error["details"],
+        )
         assert error.field == sample_validation_error["field"]
         assert error.value == sample_validation_error["value"]
+        assert error.details == sample_validation_error["details"]
 
 
 class TestConfigurationError:
     """Test cases for ConfigurationError exception."""
 
-    @pytest.mark.unit
     def test_configuration_error_creation(self) -> None:
         """Test ConfigurationError creation."""
         error = ConfigurationError(
@@ -114,7 +152,6 @@ class TestConfigurationError:
         assert error.expected == "valid connection string"
         assert "DATABASE_URL" in str(error)
 
-    @pytest.mark.unit
     def test_configuration_error_with_details(self) -> None:
         """Test ConfigurationError with details."""
         error = ConfigurationError(
@@ -124,13 +161,6 @@ class TestConfigurationError:
         )
         assert error.details == "Check environment variables"
 
-    @pytest.mark.unit
-    def test_configuration_error_inheritance(self) -> None:
-        """Test that ConfigurationError inherits from HelloWorldError."""
-        error = ConfigurationError("key", "expected")
-        assert isinstance(error, HelloWorldError)
-
-    @pytest.mark.unit
     def test_configuration_error_with_fixture(self, sample_configuration_error: dict[str, str]) -> None:
         """Test ConfigurationError creation using fixture."""
         error = ConfigurationError(**sample_configuration_error)
@@ -140,7 +170,6 @@ class TestConfigurationError:
 class TestGreetingError:
     """Test cases for GreetingError exception."""
 
-    @pytest.mark.unit
     def test_greeting_error_without_name(self) -> None:
         """Test GreetingError creation without name."""
         error = GreetingError(error_type="invalid_input")
@@ -148,14 +177,12 @@ class TestGreetingError:
         assert error.name is None
         assert "invalid_input" in str(error)
 
-    @pytest.mark.unit
     def test_greeting_error_with_name(self) -> None:
         """Test GreetingError creation with name."""
         error = GreetingError(error_type="validation_failed", name="BadName")
         assert error.name == "BadName"
         assert "BadName" in str(error)
 
-    @pytest.mark.unit
     def test_greeting_error_with_details(self) -> None:
         """Test GreetingError with details."""
         error = GreetingError(
@@ -165,17 +192,10 @@ class TestGreetingError:
         )
         assert error.details == "Max length is 100"
 
-    @pytest.mark.unit
-    def test_greeting_error_inheritance(self) -> None:
-        """Test that GreetingError inherits from HelloWorldError."""
-        error = GreetingError("error")
-        assert isinstance(error, HelloWorldError)
-
 
 class TestBatchGreetingError:
     """Test cases for BatchGreetingError exception."""
 
-    @pytest.mark.unit
     def test_batch_error_creation(self) -> None:
         """Test BatchGreetingError creation."""
         error = BatchGreetingError(
@@ -183,24 +203,23 @@ class TestBatchGreetingError:
             total_count=5,
             success_count=3,
         )
-        assert error.failed_names == ["Bad1", "Bad2"]
+        assert error.failed_names == ("Bad1", "Bad2")
         assert error.total_count == 5
         assert error.success_count == 3
         assert "2/5 failures" in str(error)
 
-    @pytest.mark.unit
-    def test_batch_error_truncates_names(self) -> None:
+    @pytest.mark.parametrize("count", [10, 100, 1000])
+    def test_batch_error_truncates_names(self, count: int) -> None:
         """Test that BatchGreetingError truncates long lists of names."""
-        many_names = [f"Name{i}" for i in range(10)]
         error = BatchGreetingError(
-            failed_names=many_names,
-            total_count=10,
+            failed_names=_TRUNCATION_NAMES[:count],
+            total_count=count,
             success_count=0,
         )
-        # Should show ... for truncated names
-        assert "..." in str(error)
+        # Should show only the first five names, followed by ...
+        assert f"{count}/{count} failures" in str(error)
+        assert str(error).endswith("Name3, Name4...")
 
-    @pytest.mark.unit
     def test_batch_error_shows_all_short_list(self) -> None:
         """Test that short lists of names are shown completely."""
         error = BatchGreetingError(
@@ -213,13 +232,6 @@ class TestBatchGreetingError:
         assert "A" in error_str
         assert "B" in error_str
 
-    @pytest.mark.unit
-    def test_batch_error_inheritance(self) -> None:
-        """Test that BatchGreetingError inherits from HelloWorldError."""
-        error = BatchGreetingError([], 0, 0)
-        assert isinstance(error, HelloWorldError)
-
-    @pytest.mark.unit
     def test_batch_error_failed_names_is_copy(self) -> None:
         """Test that failed_names is a copy, not the original list."""
         original = ["Name1", "Name2"]
@@ -231,25 +243,19 @@ class TestBatchGreetingError:
 class TestExceptionCatching:
     """Test cases for exception catching patterns."""
 
-    @pytest.mark.unit
-    def test_catch_all_package_errors(self) -> None:
+    @pytest.mark.parametrize("error_factory", _ERROR_FACTORIES)
+    def test_catch_all_package_errors(self, error_factory: Callable[[], HelloWorldError]) -> None:
         """Test catching all package errors with base class."""
-        errors = [
-            HelloWorldError("base"),
-            ValidationError("f", "v", "r"),
-            ConfigurationError("k", "e"),
-            GreetingError("t"),
-            BatchGreetingError([], 0, 0),
-        ]
-        for error in errors:
-            with pytest.raises(HelloWorldError):
-                raise error
-
-    @pytest.mark.unit
+        with pytest.raises(HelloWorldError):
+            raise error_factory()
+
+    @pytest.mark.parametrize("error_factory", _ERROR_FACTORIES)
+    def test_inherits_from_base(self, error_factory: Callable[[], HelloWorldError]) -> None:
+        """Test that every package exception inherits from HelloWorldError."""
+        error = error_factory()
+        assert isinstance(error, HelloWorldError)
+        assert isinstance(error, Exception)
+
     def test_specific_error_not_caught_by_sibling(self) -> None:
         """Test that specific errors aren't caught by sibling classes."""
-        with pytest.raises(ValidationError):
-            try:
-                raise ValidationError("f", "v", "r")
-            except ConfigurationError:
-                pytest.fail("Should not catch ValidationError")
+        assert not issubclass(ValidationError, ConfigurationError)
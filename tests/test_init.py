@@ -1,11 +1,7 @@
-"""Tests for package initialization.
-
-Author: JacobPEvans
-Created: July 13, 2025
-"""
+"""Tests for hello_world package initialization."""
 
 import importlib
-from pathlib import Path
+from types import ModuleType
 from unittest.mock import patch
 
 import pytest
@@ -27,40 +23,62 @@ from hello_world import (
 )
 
 
+pytestmark = pytest.mark.unit
+
+
 class TestPackageInit:
     """Test cases for package initialization."""
 
-    @pytest.mark.unit
-    def test_logging_config_missing_file(self) -> None:
+    def test_logging_config_missing_file(self, unloaded_hello_world: ModuleType) -> None:
         """Test package initialization when logging.conf doesn't exist."""
-        with patch.object(Path, "exists", return_value=False):
-            importlib.reload(hello_world)
-
-        # Verify the module still works despite missing config
-        assert hello_world.greet() == "Hello, World!"
+        with patch("pathlib.Path.is_file", return_value=False), patch("logging.config.fileConfig") as file_config:
+            # Verify the module still works despite missing config
+            assert unloaded_hello_world.greet() == "Hello, World!"
+        file_config.assert_not_called()
 
-    @pytest.mark.unit
-    def test_logging_config_present(self) -> None:
+    def test_logging_config_present(self, unloaded_hello_world: ModuleType) -> None:
         """Test package initialization when logging.conf exists."""
-        # Reload to ensure logging is configured
-        importlib.reload(hello_world)
-        assert hello_world.greet() == "Hello, World!"
+        with patch("logging.config.fileConfig") as file_config:
+            assert unloaded_hello_world.greet() == "Hello, World!"
+        file_config.assert_called_once()
+        # Loggers of the importing application must stay enabled
+        assert file_config.call_args.kwargs == {"disable_existing_loggers": False}
+
+    def test_logging_configured_on_direct_main_import(self, unloaded_hello_world: ModuleType) -> None:
+        """Test that importing hello_world.main directly applies logging.conf."""
+        with patch("logging.config.fileConfig") as file_config:
+            main = importlib.import_module("hello_world.main")
+        file_config.assert_called_once()
+        assert main.greet() == "Hello, World!"
+        assert "greet" not in vars(unloaded_hello_world)
+
+    def test_dir_lists_lazy_exports(self, unloaded_hello_world: ModuleType) -> None:
+        """Test that dir() includes lazy exports before they are loaded."""
+        assert set(unloaded_hello_world.__all__) <= set(dir(unloaded_hello_world))
+
+    def test_lazy_export_cached(self, unloaded_hello_world: ModuleType) -> None:
+        """Test that a lazily loaded export is stored on the package."""
+        assert "greet_many" not in vars(unloaded_hello_world)
+        assert unloaded_hello_world.greet_many(["A"]) == ["Hello, A!"]
+        assert "greet_many" in vars(unloaded_hello_world)
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unknown attributes still raise AttributeError."""
+        with pytest.raises(AttributeError, match="no_such_name"):
+            _ = hello_world.no_such_name
 
 
 class TestPackageMetadata:
     """Test cases for package metadata."""
 
-    @pytest.mark.unit
     def test_version(self) -> None:
         """Test package version is defined."""
         assert hello_world.__version__ == "0.1.0"
 
-    @pytest.mark.unit
     def test_author(self) -> None:
         """Test package author is defined."""
         assert hello_world.__author__ == "JacobPEvans"
 
-    @pytest.mark.unit
     def test_email(self) -> None:
         """Test package email is defined."""
         assert "@" in hello_world.__email__
@@ -69,40 +87,34 @@ class TestPackageMetadata:
 class TestPackageExports:
     """Test cases for package exports."""
 
-    @pytest.mark.unit
     def test_greet_exported(self) -> None:
         """Test greet function is exported."""
         assert greet is not None
         assert callable(greet)
         assert greet() == "Hello, World!"
 
-    @pytest.mark.unit
     def test_greet_many_exported(self) -> None:
         """Test greet_many function is exported."""
         assert greet_many is not None
         assert callable(greet_many)
         assert greet_many(["A"]) == ["Hello, A!"]
 
-    @pytest.mark.unit
     def test_create_greeting_template_exported(self) -> None:
         """Test create_greeting_template is exported."""
         assert create_greeting_template is not None
         assert callable(create_greeting_template)
 
-    @pytest.mark.unit
     def test_format_greeting_exported(self) -> None:
         """Test format_greeting is exported."""
         assert format_greeting is not None
         assert callable(format_greeting)
 
-    @pytest.mark.unit
     def test_validators_exported(self) -> None:
         """Test validator functions are exported."""
         assert validate_name is not None
         assert validate_names_batch is not None
         assert validate_positive_int is not None
 
-    @pytest.mark.unit
     def test_exceptions_exported(self) -> None:
         """Test exception classes are exported."""
         assert HelloWorldError is not None
@@ -111,7 +123,6 @@ class TestPackageExports:
         assert GreetingError is not None
         assert BatchGreetingError is not None
 
-    @pytest.mark.unit
     def test_all_exports(self) -> None:
         """Test __all__ contains expected exports."""
         expected_exports = {
@@ -137,42 +148,30 @@ class TestPackageExports:
 class TestPackageUsage:
     """Test cases for typical package usage patterns."""
 
-    @pytest.mark.unit
     def test_import_star(self) -> None:
         """Test that importing * gives expected symbols."""
-        # This tests that __all__ is properly defined
-        module_dict: dict[str, object] = {}
-        exec("from hello_world import *", module_dict)  # noqa: S102
+        # A star import resolves every name in __all__, including lazy exports
+        assert "greet" in hello_world.__all__
+        assert "ValidationError" in hello_world.__all__
+        for name in hello_world.__all__:
+            assert getattr(hello_world, name) is not None
 
-        assert "greet" in module_dict
-        assert "ValidationError" in module_dict
-
-    @pytest.mark.unit
     def test_typical_usage(self) -> None:
         """Test a typical usage pattern of the package."""
-        # Import and use
-        from hello_world import greet, validate_name
-
         name = validate_name("  User  ")
         result = greet(name)
         assert result == "Hello, User!"
 
-    @pytest.mark.unit
     def test_exception_handling_pattern(self) -> None:
         """Test typical exception handling pattern."""
-        from hello_world import HelloWorldError, greet
-
         try:
             # This won't raise, but shows the pattern
             greet("Test")
         except HelloWorldError:
             pytest.fail("Should not raise")
 
-    @pytest.mark.unit
     def test_batch_operations(self) -> None:
         """Test batch operations work as expected."""
-        from hello_world import greet_many
-
         names = ["Alice", "Bob", None, ""]
         results = greet_many(names)
         assert len(results) == 4